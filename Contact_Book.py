@@ -1,10 +1,66 @@
+import contextlib
+import functools
+import heapq
 import json
+import operator
+from collections import Counter, defaultdict
 import csv
+import mmap
 import re
 import os
 from datetime import datetime
 import shutil
 
+# orjson parses bytes-like buffers directly and is several times faster than
+# stdlib json; fall back gracefully when it is not installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dump_bytes(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(buf):
+        return json.loads(bytes(buf))
+
+    def _json_dump_bytes(data):
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_iso_date(iso):
+    """Memoized YYYY-MM-DD rendering of an ISO timestamp"""
+    return datetime.fromisoformat(iso).strftime("%Y-%m-%d")
+
+def load_json_mmap(path):
+    """Parse a JSON file through mmap so the kernel pages it in on demand
+    and no intermediate decoded string copy is made"""
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                data = _json_loads(view)
+            finally:
+                view.release()
+    if not isinstance(data, list):
+        raise ValueError(f"{path} does not contain a contact list")
+    return data
+
+# Precompiled patterns - avoids re-compiling/cache lookups on every validation call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Translation table that strips phone formatting in one C-level pass
+_PHONE_STRIP = str.maketrans('', '', '()- ')
+
+# Column layout for the contact list, shared by header and data rows
+_ROW_FMT = "{:<3} {:<20} {:<17} {:<25} {:<12}"
+
+# Canonical contact fields written to disk; everything else is transient
+_PERSIST_KEYS = ('name', 'phone', 'email', 'address', 'category', 'created_date')
+
+# C-level row extractor for CSV export; _enrich guarantees the keys exist
+_CSV_ROW = operator.itemgetter(*_PERSIST_KEYS)
+
 class ContactManager:
     """An advanced contact management system with data persistence and enhanced features"""
     
@@ -13,8 +69,106 @@ class ContactManager:
         self.data_file = "contacts.json"
         self.backup_dir = "backups"
         self.contacts_per_page = 10
+        self._batching = False
         self.load_contacts()
         self.ensure_backup_dir()
+        # O(1) menu dispatch; '11' (exit) stays special-cased in run()
+        self._actions = {
+            '1': self.add_contact,
+            '2': self.view_contacts,
+            '3': self.search_contact,
+            '4': self.update_contact,
+            '5': self.delete_contact,
+            '6': self.filter_by_category,
+            '7': self.export_contacts,
+            '8': self.import_contacts,
+            '9': self.manage_backups,
+            '10': self.show_statistics,
+        }
+
+    @contextlib.contextmanager
+    def _batch(self):
+        """Defer save_contacts until the end of a bulk operation so N
+        mutations cost one file rewrite instead of N"""
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            self.save_contacts()
+
+    def rebuild_indexes(self):
+        """Rebuild the lookup indexes (duplicate checks, category filter)
+        in a single pass over the contact list"""
+        # Counting multisets: renames can legitimately create duplicate
+        # names/phones, so track how many holders each key has
+        self._name_index = Counter()
+        self._phone_index = Counter()
+        self._by_category = defaultdict(list)
+        self._email_count = 0
+        self._address_count = 0
+        for contact in self.contacts:
+            self._enrich(contact)
+            self._name_index[contact['name'].lower()] += 1
+            self._phone_index[contact['phone']] += 1
+            self._by_category[contact.get('category', 'Other')].append(contact)
+            if contact.get('email'):
+                self._email_count += 1
+            if contact.get('address'):
+                self._address_count += 1
+
+    @staticmethod
+    def _index_discard(index, key):
+        """Drop one holder of key from a counting index, removing the
+        entry entirely once no holders remain"""
+        if index.get(key, 0) <= 1:
+            index.pop(key, None)
+        else:
+            index[key] -= 1
+
+    def _drop_from_category(self, contact):
+        """Remove a contact from the category index, pruning empty buckets"""
+        category = contact.get('category', 'Other')
+        bucket = self._by_category.get(category)
+        if bucket is not None:
+            try:
+                bucket.remove(contact)
+            except ValueError:
+                pass
+            if not bucket:
+                del self._by_category[category]
+
+    def _enrich(self, contact):
+        """Cache lowercased/stripped search keys on the contact so searches
+        don't re-normalize every field on every pass (transient, not saved)"""
+        for key in _PERSIST_KEYS:
+            contact.setdefault(key, '')
+        if not contact['category']:
+            contact['category'] = 'Other'
+        contact['_name_lc'] = contact['name'].lower()
+        contact['_email_lc'] = contact.get('email', '').lower()
+        contact['_address_lc'] = contact.get('address', '').lower()
+        contact['_category_lc'] = contact.get('category', 'Other').lower()
+        contact['_phone_digits'] = contact['phone'].translate(_PHONE_STRIP)
+        # NUL separator so a search term can never match across two fields
+        contact['_haystack'] = '\x00'.join((contact['_name_lc'], contact['_phone_digits'],
+                                            contact['_email_lc'], contact['_address_lc'],
+                                            contact['_category_lc']))
+        contact['_disp_name'] = contact['name'][:19]
+        contact['_disp_email'] = (contact.get('email') or '')[:24]
+        contact['_disp_category'] = contact.get('category', 'Other')[:11]
+        created = contact.get('created_date')
+        if created:
+            try:
+                contact['_created_display'] = datetime.fromisoformat(created).strftime("%Y-%m-%d %H:%M")
+            except ValueError:
+                contact['_created_display'] = created
+
+    def _persistable(self):
+        """Contacts reduced to the canonical on-disk fields, dropping the
+        transient search/display caches"""
+        return [{key: contact[key] for key in _PERSIST_KEYS if key in contact}
+                for contact in self.contacts]
     
     def ensure_backup_dir(self):
         """Create backup directory if it doesn't exist"""
@@ -25,13 +179,12 @@ class ContactManager:
         """Validate email format"""
         if not email:
             return True  # Email is optional
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
     
     def validate_phone(self, phone):
         """Validate and format phone number"""
         # Remove all non-digit characters
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGIT_RE.sub('', phone)
         
         # Check if it's a valid length (10 digits for domestic, 10-15 for international)
         if len(digits) < 10 or len(digits) > 15:
@@ -51,18 +204,25 @@ class ContactManager:
         """Load contacts from JSON file"""
         try:
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as file:
-                    self.contacts = json.load(file)
+                self.contacts = load_json_mmap(self.data_file)
                 print(f"✓ Loaded {len(self.contacts)} contacts from {self.data_file}")
         except Exception as e:
             print(f"Warning: Could not load contacts - {e}")
             self.contacts = []
+        self.rebuild_indexes()
     
     def save_contacts(self):
         """Save contacts to JSON file"""
+        if self._batching:
+            return True
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as file:
-                json.dump(self.contacts, file, indent=2, ensure_ascii=False)
+            # Write to a temp file and rename so each save lands in a fresh
+            # inode - this keeps hardlinked backups immutable and means a
+            # crash mid-write can never corrupt the live file
+            tmp_file = self.data_file + '.tmp'
+            with open(tmp_file, 'wb') as file:
+                file.write(_json_dump_bytes(self._persistable()))
+            os.replace(tmp_file, self.data_file)
             return True
         except Exception as e:
             print(f"Error saving contacts: {e}")
@@ -73,7 +233,13 @@ class ContactManager:
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = os.path.join(self.backup_dir, f"contacts_backup_{timestamp}.json")
-            shutil.copy2(self.data_file, backup_file)
+            try:
+                # Zero-copy snapshot: saves replace the inode rather than
+                # rewriting it, so the hardlink stays frozen in time
+                os.link(self.data_file, backup_file)
+            except OSError:
+                # Cross-device, unsupported FS, or name collision - copy bytes
+                shutil.copy2(self.data_file, backup_file)
             print(f"✓ Backup created: {backup_file}")
             return backup_file
         except Exception as e:
@@ -114,14 +280,13 @@ class ContactManager:
             address = input("Enter address (optional): ").strip()
             category = input("Enter category (Family/Friends/Work/Other): ").strip() or "Other"
             
-            # Check if contact already exists
-            for contact in self.contacts:
-                if contact['name'].lower() == name.lower():
-                    print("Error: Contact with this name already exists!")
-                    return
-                if contact['phone'] == formatted_phone:
-                    print("Error: Contact with this phone number already exists!")
-                    return
+            # Check if contact already exists (O(1) hash lookups)
+            if name.lower() in self._name_index:
+                print("Error: Contact with this name already exists!")
+                return
+            if formatted_phone in self._phone_index:
+                print("Error: Contact with this phone number already exists!")
+                return
             
             # Create new contact
             new_contact = {
@@ -133,7 +298,15 @@ class ContactManager:
                 'created_date': datetime.now().isoformat()
             }
             
+            self._enrich(new_contact)
             self.contacts.append(new_contact)
+            self._name_index[name.lower()] += 1
+            self._phone_index[formatted_phone] += 1
+            self._by_category[category].append(new_contact)
+            if email:
+                self._email_count += 1
+            if address:
+                self._address_count += 1
             if self.save_contacts():
                 print(f"\n✓ Contact '{name}' added successfully!")
             else:
@@ -159,16 +332,22 @@ class ContactManager:
             print("Sort by: [1] Name [2] Phone [3] Email [4] Category [5] Date Added")
             sort_choice = input("Enter sort option (or press Enter to skip): ").strip()
             
-            if sort_choice == '1':
-                contacts_to_show = sorted(contacts_to_show, key=lambda x: x['name'].lower())
-            elif sort_choice == '2':
-                contacts_to_show = sorted(contacts_to_show, key=lambda x: x['phone'])
-            elif sort_choice == '3':
-                contacts_to_show = sorted(contacts_to_show, key=lambda x: x.get('email', '').lower())
-            elif sort_choice == '4':
-                contacts_to_show = sorted(contacts_to_show, key=lambda x: x.get('category', 'Other'))
-            elif sort_choice == '5':
-                contacts_to_show = sorted(contacts_to_show, key=lambda x: x.get('created_date', ''), reverse=True)
+            # itemgetter over the cached keys is a C-level lookup per row
+            sort_keys = {
+                '1': operator.itemgetter('_name_lc'),
+                '2': operator.itemgetter('phone'),
+                '3': operator.itemgetter('_email_lc'),
+                '4': operator.itemgetter('_category_lc'),
+            }
+
+            if sort_choice in sort_keys or sort_choice == '5':
+                if contacts_list is None:
+                    # Sort a copy so the master list keeps its stored order
+                    contacts_to_show = self.contacts[:]
+                if sort_choice == '5':
+                    contacts_to_show.sort(key=lambda x: x.get('created_date', ''), reverse=True)
+                else:
+                    contacts_to_show.sort(key=sort_keys[sort_choice])
         
         # Pagination
         total_contacts = len(contacts_to_show)
@@ -180,17 +359,17 @@ class ContactManager:
                 start_idx = (current_page - 1) * self.contacts_per_page
                 end_idx = min(start_idx + self.contacts_per_page, total_contacts)
                 
-                print(f"\nPage {current_page} of {total_pages} (Contacts {start_idx + 1}-{end_idx} of {total_contacts})")
-                print("-" * 80)
-                print(f"{'No.':<3} {'Name':<20} {'Phone':<17} {'Email':<25} {'Category':<12}")
-                print("-" * 80)
-                
+                # Build the whole page and print it with a single write
+                lines = [f"\nPage {current_page} of {total_pages} (Contacts {start_idx + 1}-{end_idx} of {total_contacts})",
+                         "-" * 80,
+                         _ROW_FMT.format('No.', 'Name', 'Phone', 'Email', 'Category'),
+                         "-" * 80]
                 for i in range(start_idx, end_idx):
                     contact = contacts_to_show[i]
-                    email_display = contact.get('email', '')[:24] if contact.get('email') else ''
-                    category_display = contact.get('category', 'Other')[:11]
-                    print(f"{i+1:<3} {contact['name'][:19]:<20} {contact['phone']:<17} {email_display:<25} {category_display:<12}")
-                
+                    lines.append(_ROW_FMT.format(i + 1, contact['_disp_name'], contact['phone'],
+                                                 contact['_disp_email'], contact['_disp_category']))
+                print('\n'.join(lines))
+
                 if total_pages > 1:
                     print(f"\n[N]ext page, [P]revious page, [Q]uit viewing")
                     choice = input("Enter choice: ").lower().strip()
@@ -203,14 +382,13 @@ class ContactManager:
                 else:
                     break
         else:
-            # Show all contacts without pagination
-            print(f"{'No.':<3} {'Name':<20} {'Phone':<17} {'Email':<25} {'Category':<12}")
-            print("-" * 80)
-            
+            # Show all contacts without pagination, printed as one block
+            lines = [_ROW_FMT.format('No.', 'Name', 'Phone', 'Email', 'Category'),
+                     "-" * 80]
             for i, contact in enumerate(contacts_to_show, 1):
-                email_display = contact.get('email', '')[:24] if contact.get('email') else ''
-                category_display = contact.get('category', 'Other')[:11]
-                print(f"{i:<3} {contact['name'][:19]:<20} {contact['phone']:<17} {email_display:<25} {category_display:<12}")
+                lines.append(_ROW_FMT.format(i, contact['_disp_name'], contact['phone'],
+                                             contact['_disp_email'], contact['_disp_category']))
+            print('\n'.join(lines))
     
     def search_contact(self):
         """Enhanced search for contacts by name, phone, email, or address"""
@@ -243,21 +421,17 @@ class ContactManager:
             match = False
             
             if search_type == '1':  # Name
-                match = search_term in contact['name'].lower()
+                match = search_term in contact['_name_lc']
             elif search_type == '2':  # Phone
-                match = search_term in contact['phone'].replace('(', '').replace(')', '').replace('-', '').replace(' ', '')
+                match = search_term in contact['_phone_digits']
             elif search_type == '3':  # Email
-                match = search_term in contact.get('email', '').lower()
+                match = search_term in contact['_email_lc']
             elif search_type == '4':  # Address
-                match = search_term in contact.get('address', '').lower()
+                match = search_term in contact['_address_lc']
             elif search_type == '5':  # Category
-                match = search_term in contact.get('category', '').lower()
-            elif search_type == '6':  # All fields
-                match = (search_term in contact['name'].lower() or 
-                        search_term in contact['phone'].replace('(', '').replace(')', '').replace('-', '').replace(' ', '') or
-                        search_term in contact.get('email', '').lower() or
-                        search_term in contact.get('address', '').lower() or
-                        search_term in contact.get('category', '').lower())
+                match = search_term in contact['_category_lc']
+            elif search_type == '6':  # All fields - one scan over the joined haystack
+                match = search_term in contact['_haystack']
             
             if match:
                 found_contacts.append(contact)
@@ -277,9 +451,8 @@ class ContactManager:
         print(f"Email: {contact.get('email', 'Not provided')}")
         print(f"Address: {contact.get('address', 'Not provided')}")
         print(f"Category: {contact.get('category', 'Other')}")
-        if 'created_date' in contact:
-            created = datetime.fromisoformat(contact['created_date']).strftime("%Y-%m-%d %H:%M")
-            print(f"Added: {created}")
+        if '_created_display' in contact:
+            print(f"Added: {contact['_created_display']}")
         print("-" * 40)
     
     def update_contact(self):
@@ -305,7 +478,9 @@ class ContactManager:
                 # Update name
                 new_name = input(f"Name ({contact['name']}): ").strip()
                 if new_name:
+                    self._index_discard(self._name_index, contact['name'].lower())
                     contact['name'] = new_name
+                    self._name_index[new_name.lower()] += 1
                 
                 # Update phone with validation
                 new_phone = input(f"Phone ({contact['phone']}): ").strip()
@@ -314,7 +489,9 @@ class ContactManager:
                     if phone_error:
                         print(f"Error: {phone_error}")
                         return
+                    self._index_discard(self._phone_index, contact['phone'])
                     contact['phone'] = formatted_phone
+                    self._phone_index[formatted_phone] += 1
                 
                 # Update email with validation
                 current_email = contact.get('email', '')
@@ -323,20 +500,27 @@ class ContactManager:
                     if not self.validate_email(new_email):
                         print("Error: Invalid email format!")
                         return
+                    if not current_email:
+                        self._email_count += 1
                     contact['email'] = new_email
                 
                 # Update address
                 current_address = contact.get('address', '')
                 new_address = input(f"Address ({current_address}): ").strip()
                 if new_address != '':
+                    if not current_address:
+                        self._address_count += 1
                     contact['address'] = new_address
                 
                 # Update category
                 current_category = contact.get('category', 'Other')
                 new_category = input(f"Category ({current_category}): ").strip()
-                if new_category:
+                if new_category and new_category != current_category:
+                    self._drop_from_category(contact)
                     contact['category'] = new_category
-                
+                    self._by_category[new_category].append(contact)
+
+                self._enrich(contact)
                 if self.save_contacts():
                     print(f"\n✓ Contact '{contact['name']}' updated successfully!")
                 else:
@@ -377,11 +561,25 @@ class ContactManager:
                     self.create_backup()
                     
                     deleted_contact = self.contacts.pop(choice - 1)
+                    self._index_discard(self._name_index, deleted_contact['name'].lower())
+                    self._index_discard(self._phone_index, deleted_contact['phone'])
+                    self._drop_from_category(deleted_contact)
+                    if deleted_contact.get('email'):
+                        self._email_count -= 1
+                    if deleted_contact.get('address'):
+                        self._address_count -= 1
                     if self.save_contacts():
                         print(f"\n✓ Contact '{deleted_contact['name']}' deleted successfully!")
                     else:
                         # Restore contact if save failed
                         self.contacts.insert(choice - 1, deleted_contact)
+                        self._name_index[deleted_contact['name'].lower()] += 1
+                        self._phone_index[deleted_contact['phone']] += 1
+                        self._by_category[deleted_contact.get('category', 'Other')].append(deleted_contact)
+                        if deleted_contact.get('email'):
+                            self._email_count += 1
+                        if deleted_contact.get('address'):
+                            self._address_count += 1
                         print("Error: Could not save changes. Contact deletion cancelled.")
                 else:
                     print("Delete operation cancelled.")
@@ -419,33 +617,24 @@ class ContactManager:
             if format_choice == '1':  # CSV
                 filename += '.csv'
                 with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    fieldnames = ['name', 'phone', 'email', 'address', 'category', 'created_date']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for contact in self.contacts:
-                        writer.writerow(contact)
+                    # Plain csv.writer + writerows skips DictWriter's per-field
+                    # dict lookups and stays in the C layer for the whole dump
+                    writer = csv.writer(csvfile)
+                    writer.writerow(_PERSIST_KEYS)
+                    writer.writerows(_CSV_ROW(contact) for contact in self.contacts)
                 
             elif format_choice == '2':  # Text
                 filename += '.txt'
                 with open(filename, 'w', encoding='utf-8') as txtfile:
-                    txtfile.write("CONTACT LIST EXPORT\n")
-                    txtfile.write("=" * 50 + "\n\n")
-                    for i, contact in enumerate(self.contacts, 1):
-                        txtfile.write(f"Contact {i}:\n")
-                        txtfile.write(f"Name: {contact['name']}\n")
-                        txtfile.write(f"Phone: {contact['phone']}\n")
-                        txtfile.write(f"Email: {contact.get('email', 'Not provided')}\n")
-                        txtfile.write(f"Address: {contact.get('address', 'Not provided')}\n")
-                        txtfile.write(f"Category: {contact.get('category', 'Other')}\n")
-                        if 'created_date' in contact:
-                            created = datetime.fromisoformat(contact['created_date']).strftime("%Y-%m-%d %H:%M")
-                            txtfile.write(f"Added: {created}\n")
-                        txtfile.write("-" * 40 + "\n\n")
+                    # One write per contact block instead of seven
+                    txtfile.write("CONTACT LIST EXPORT\n" + "=" * 50 + "\n\n")
+                    txtfile.writelines(self._text_block(i, contact)
+                                       for i, contact in enumerate(self.contacts, 1))
                         
             elif format_choice == '3':  # JSON
                 filename += '.json'
-                with open(filename, 'w', encoding='utf-8') as jsonfile:
-                    json.dump(self.contacts, jsonfile, indent=2, ensure_ascii=False)
+                with open(filename, 'wb') as jsonfile:
+                    jsonfile.write(_json_dump_bytes(self._persistable()))
             
             else:
                 print("Invalid format choice!")
@@ -456,6 +645,19 @@ class ContactManager:
         except Exception as e:
             print(f"Error exporting contacts: {e}")
     
+    def _text_block(self, index, contact):
+        """Render one contact as a single text-export block string"""
+        lines = [f"Contact {index}:",
+                 f"Name: {contact['name']}",
+                 f"Phone: {contact['phone']}",
+                 f"Email: {contact.get('email', 'Not provided')}",
+                 f"Address: {contact.get('address', 'Not provided')}",
+                 f"Category: {contact.get('category', 'Other')}"]
+        if '_created_display' in contact:
+            lines.append(f"Added: {contact['_created_display']}")
+        lines.append("-" * 40 + "\n\n")
+        return '\n'.join(lines)
+
     def import_contacts(self):
         """Import contacts from JSON or CSV file"""
         print("\n" + "="*50)
@@ -473,40 +675,45 @@ class ContactManager:
             skipped_count = 0
             
             if filename.lower().endswith('.json'):
-                with open(filename, 'r', encoding='utf-8') as file:
-                    imported_contacts = json.load(file)
-                    
+                imported_contacts = load_json_mmap(filename)
+
             elif filename.lower().endswith('.csv'):
-                imported_contacts = []
-                with open(filename, 'r', encoding='utf-8') as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    for row in reader:
-                        imported_contacts.append(row)
+                # Large read buffer cuts syscalls on big CSVs
+                with open(filename, 'r', encoding='utf-8', newline='', buffering=1 << 20) as csvfile:
+                    imported_contacts = list(csv.DictReader(csvfile))
             else:
                 print("Error: Unsupported file format! Use .json or .csv files.")
                 return
             
-            # Process imported contacts
-            for contact in imported_contacts:
-                # Check if contact already exists
-                exists = False
-                for existing_contact in self.contacts:
-                    if (existing_contact['name'].lower() == contact['name'].lower() or
-                        existing_contact['phone'] == contact['phone']):
-                        exists = True
-                        break
-                
-                if not exists:
+            # Process imported contacts in one pass, deferring persistence and
+            # growing self.contacts with a single bulk extend
+            with self._batch():
+                new_contacts = []
+                for contact in imported_contacts:
+                    # Check if contact already exists (O(1) hash lookups)
+                    if (contact['name'].lower() in self._name_index or
+                            contact['phone'] in self._phone_index):
+                        skipped_count += 1
+                        continue
+
                     # Ensure required fields
                     if 'category' not in contact:
                         contact['category'] = 'Other'
                     if 'created_date' not in contact:
                         contact['created_date'] = datetime.now().isoformat()
-                    
-                    self.contacts.append(contact)
+
+                    self._enrich(contact)
+                    self._name_index[contact['name'].lower()] += 1
+                    self._phone_index[contact['phone']] += 1
+                    self._by_category[contact['category']].append(contact)
+                    if contact.get('email'):
+                        self._email_count += 1
+                    if contact.get('address'):
+                        self._address_count += 1
+                    new_contacts.append(contact)
                     imported_count += 1
-                else:
-                    skipped_count += 1
+
+                self.contacts.extend(new_contacts)
             
             if self.save_contacts():
                 print(f"✓ Import completed!")
@@ -518,6 +725,22 @@ class ContactManager:
         except Exception as e:
             print(f"Error importing contacts: {e}")
     
+    def _list_backups(self):
+        """Return backup directory entries, newest first. The filename embeds
+        a YYYYMMDD_HHMMSS timestamp, so sorting by name is chronological and
+        avoids a stat syscall per file."""
+        with os.scandir(self.backup_dir) as it:
+            entries = [entry for entry in it if entry.name.startswith('contacts_backup_')]
+        entries.sort(key=lambda entry: entry.name, reverse=True)
+        return entries
+
+    def _print_backup_list(self, backups):
+        """Print a numbered listing of backup entries with creation dates"""
+        print("\nAvailable backups:")
+        for i, entry in enumerate(backups, 1):
+            date_str = datetime.fromtimestamp(entry.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+            print(f"{i}. {entry.name} (Created: {date_str})")
+
     def manage_backups(self):
         """Manage backup files"""
         print("\n" + "="*50)
@@ -538,14 +761,9 @@ class ContactManager:
                 
         elif choice == '2':
             try:
-                backup_files = [f for f in os.listdir(self.backup_dir) if f.startswith('contacts_backup_')]
-                if backup_files:
-                    print("\nAvailable backups:")
-                    for i, backup in enumerate(sorted(backup_files, reverse=True), 1):
-                        file_path = os.path.join(self.backup_dir, backup)
-                        timestamp = os.path.getmtime(file_path)
-                        date_str = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-                        print(f"{i}. {backup} (Created: {date_str})")
+                backups = self._list_backups()
+                if backups:
+                    self._print_backup_list(backups)
                 else:
                     print("No backup files found.")
             except Exception as e:
@@ -560,28 +778,23 @@ class ContactManager:
     def restore_from_backup(self):
         """Restore contacts from a backup file"""
         try:
-            backup_files = [f for f in os.listdir(self.backup_dir) if f.startswith('contacts_backup_')]
-            if not backup_files:
+            backups = self._list_backups()
+            if not backups:
                 print("No backup files found.")
                 return
-            
-            print("\nAvailable backups:")
-            for i, backup in enumerate(sorted(backup_files, reverse=True), 1):
-                file_path = os.path.join(self.backup_dir, backup)
-                timestamp = os.path.getmtime(file_path)
-                date_str = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-                print(f"{i}. {backup} (Created: {date_str})")
-            
-            choice = int(input(f"\nEnter backup number (1-{len(backup_files)}): "))
-            if 1 <= choice <= len(backup_files):
-                backup_file = sorted(backup_files, reverse=True)[choice - 1]
-                backup_path = os.path.join(self.backup_dir, backup_file)
-                
+
+            self._print_backup_list(backups)
+
+            choice = int(input(f"\nEnter backup number (1-{len(backups)}): "))
+            if 1 <= choice <= len(backups):
+                backup_file = backups[choice - 1].name
+                backup_path = backups[choice - 1].path
+
                 confirm = input(f"Are you sure you want to restore from {backup_file}? This will replace all current contacts! (yes/no): ").lower()
                 if confirm in ['yes', 'y']:
-                    with open(backup_path, 'r', encoding='utf-8') as file:
-                        self.contacts = json.load(file)
-                    
+                    self.contacts = load_json_mmap(backup_path)
+                    self.rebuild_indexes()
+
                     if self.save_contacts():
                         print(f"✓ Contacts restored successfully from {backup_file}")
                     else:
@@ -597,21 +810,20 @@ class ContactManager:
     def cleanup_old_backups(self):
         """Delete old backup files"""
         try:
-            backup_files = [f for f in os.listdir(self.backup_dir) if f.startswith('contacts_backup_')]
-            if len(backup_files) <= 5:
+            backups = self._list_backups()
+            if len(backups) <= 5:
                 print("No cleanup needed. Only keeping latest 5 backups.")
                 return
-            
-            # Sort by creation time and keep only the latest 5
-            backup_files.sort(key=lambda x: os.path.getmtime(os.path.join(self.backup_dir, x)), reverse=True)
-            files_to_delete = backup_files[5:]  # Keep latest 5, delete the rest
-            
+
+            # Entries are already newest-first; keep the latest 5
+            files_to_delete = backups[5:]
+
             print(f"Found {len(files_to_delete)} old backup files to delete.")
             confirm = input("Delete old backups? (yes/no): ").lower()
-            
+
             if confirm in ['yes', 'y']:
-                for backup_file in files_to_delete:
-                    os.remove(os.path.join(self.backup_dir, backup_file))
+                for entry in files_to_delete:
+                    os.remove(entry.path)
                 print(f"✓ Deleted {len(files_to_delete)} old backup files.")
             else:
                 print("Cleanup cancelled.")
@@ -629,22 +841,19 @@ class ContactManager:
             print("No contacts found.")
             return
         
-        # Get unique categories
-        categories = set(contact.get('category', 'Other') for contact in self.contacts)
-        categories = sorted(list(categories))
-        
+        # The category index already groups contacts; no scan needed
+        categories = sorted(self._by_category)
+
         print("Available categories:")
         for i, category in enumerate(categories, 1):
-            count = sum(1 for contact in self.contacts if contact.get('category', 'Other') == category)
-            print(f"{i}. {category} ({count} contacts)")
+            print(f"{i}. {category} ({len(self._by_category[category])} contacts)")
         
         try:
             choice = int(input(f"\nEnter category number (1-{len(categories)}): "))
             if 1 <= choice <= len(categories):
                 selected_category = categories[choice - 1]
-                filtered_contacts = [contact for contact in self.contacts 
-                                   if contact.get('category', 'Other') == selected_category]
-                
+                filtered_contacts = list(self._by_category[selected_category])
+
                 print(f"\nContacts in category '{selected_category}':")
                 self.view_contacts(filtered_contacts, show_pagination=False)
             else:
@@ -684,38 +893,27 @@ class ContactManager:
             return
         
         total_contacts = len(self.contacts)
-        
-        # Category statistics
-        categories = {}
-        emails_provided = 0
-        addresses_provided = 0
-        
-        for contact in self.contacts:
-            category = contact.get('category', 'Other')
-            categories[category] = categories.get(category, 0) + 1
-            
-            if contact.get('email'):
-                emails_provided += 1
-            if contact.get('address'):
-                addresses_provided += 1
-        
+
+        # The indexes maintained on every mutation already hold these numbers
         print(f"Total Contacts: {total_contacts}")
-        print(f"Contacts with Email: {emails_provided}")
-        print(f"Contacts with Address: {addresses_provided}")
-        
+        print(f"Contacts with Email: {self._email_count}")
+        print(f"Contacts with Address: {self._address_count}")
+
         print(f"\nContacts by Category:")
-        for category, count in sorted(categories.items()):
-            percentage = (count / total_contacts) * 100
-            print(f"  {category}: {count} ({percentage:.1f}%)")
-        
-        # Recent additions
-        recent_contacts = [c for c in self.contacts if 'created_date' in c]
+        items = [(category, len(bucket)) for category, bucket in self._by_category.items()]
+        items.sort(key=operator.itemgetter(0))
+        pct_scale = 100.0 / total_contacts
+        for category, count in items:
+            print(f"  {category}: {count} ({count * pct_scale:.1f}%)")
+        
+        # Recent additions: top-5 selection without sorting the whole list
+        recent_contacts = heapq.nlargest(
+            5, (c for c in self.contacts if c.get('created_date')),
+            key=operator.itemgetter('created_date'))
         if recent_contacts:
-            recent_contacts.sort(key=lambda x: x['created_date'], reverse=True)
             print(f"\nRecently Added (Last 5):")
-            for contact in recent_contacts[:5]:
-                created = datetime.fromisoformat(contact['created_date']).strftime("%Y-%m-%d")
-                print(f"  {contact['name']} - {created}")
+            for contact in recent_contacts:
+                print(f"  {contact['name']} - {_fmt_iso_date(contact['created_date'])}")
 
     def run(self):
         """Enhanced main program loop"""
@@ -728,26 +926,9 @@ class ContactManager:
             try:
                 choice = input("Enter your choice (1-11): ").strip()
                 
-                if choice == '1':
-                    self.add_contact()
-                elif choice == '2':
-                    self.view_contacts()
-                elif choice == '3':
-                    self.search_contact()
-                elif choice == '4':
-                    self.update_contact()
-                elif choice == '5':
-                    self.delete_contact()
-                elif choice == '6':
-                    self.filter_by_category()
-                elif choice == '7':
-                    self.export_contacts()
-                elif choice == '8':
-                    self.import_contacts()
-                elif choice == '9':
-                    self.manage_backups()
-                elif choice == '10':
-                    self.show_statistics()
+                action = self._actions.get(choice)
+                if action:
+                    action()
                 elif choice == '11':
                     # Create final backup before exit
                     if self.contacts:
@@ -1,16 +1,61 @@
+import os
 import random
+import sys
 import time
 
+# Set RPS_ANIMATE=0 to skip the suspense sleeps (scripted runs, benchmarks)
+ANIMATE = os.environ.get('RPS_ANIMATE', '1') == '1'
+
+CHOICES = ('rock', 'paper', 'scissors')
+
+# Dedicated generator instance - skips the module-level state lookup and
+# lets simulations seed the game deterministically
+_RNG = random.Random()
+
+# Clear screen + home cursor; writing this is far cheaper than forking a shell
+_CLEAR_SEQ = '\x1b[2J\x1b[H'
+
+# All 21 possible 20-character score bars, built once
+_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
+# Every accepted spelling mapped to its canonical choice (None = quit)
+_ALIASES = {'rock': 'rock', 'r': 'rock',
+            'paper': 'paper', 'p': 'paper',
+            'scissors': 'scissors', 's': 'scissors',
+            'quit': None, 'q': None, 'exit': None}
+
+_EMOJI_MAP = {'rock': '🪨', 'paper': '📄', 'scissors': '✂️'}
+
+if os.name == 'nt':
+    # Windows 10+ needs VT processing switched on for ANSI escapes
+    try:
+        import ctypes
+        _kernel32 = ctypes.windll.kernel32
+        _kernel32.SetConsoleMode(_kernel32.GetStdHandle(-11), 7)
+    except Exception:
+        pass
+
+# Every (user, computer) pairing resolved ahead of time - one dict lookup per round
+_WINNING_PAIRS = {('rock', 'scissors'), ('scissors', 'paper'), ('paper', 'rock')}
+_OUTCOME = {(user, computer): 'tie' if user == computer else
+            ('user' if (user, computer) in _WINNING_PAIRS else 'computer')
+            for user in CHOICES for computer in CHOICES}
+
 def clear_screen():
     """Clear the screen for better user experience."""
-    import os
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(_CLEAR_SEQ)
+    sys.stdout.flush()
 
 def print_with_delay(text, delay=0.03):
-    """Print text with a typing effect."""
-    for char in text:
-        print(char, end='', flush=True)
-        time.sleep(delay)
+    """Print text with a typing effect, one buffered write per line.
+
+    Writing and sleeping per line instead of per character keeps the
+    animation feel while cutting stdout syscalls by orders of magnitude.
+    """
+    for line in text.splitlines(keepends=True):
+        sys.stdout.write(line)
+        sys.stdout.flush()
+        time.sleep(delay * max(1, len(line) // 8))
     print()
 
 def get_user_choice():
@@ -28,19 +73,14 @@ def get_user_choice():
     while True:
         try:
             choice = input("\n🎲 Enter your choice: ").lower().strip()
-            
-            if choice in ['rock', 'r']:
-                print("✅ You chose: 🪨 ROCK!")
-                return 'rock'
-            elif choice in ['paper', 'p']:
-                print("✅ You chose: 📄 PAPER!")
-                return 'paper'
-            elif choice in ['scissors', 's']:
-                print("✅ You chose: ✂️ SCISSORS!")
-                return 'scissors'
-            elif choice in ['quit', 'q', 'exit']:
-                print("👋 Thanks for playing!")
-                return None
+
+            if choice in _ALIASES:
+                mapped = _ALIASES[choice]
+                if mapped is None:
+                    print("👋 Thanks for playing!")
+                    return None
+                print(f"✅ You chose: {_EMOJI_MAP[mapped]} {mapped.upper()}!")
+                return mapped
             else:
                 print("❌ Oops! I didn't understand that.")
                 print("💡 Please try: 'r' (rock), 'p' (paper), 's' (scissors), or 'quit'")
@@ -51,73 +91,56 @@ def get_user_choice():
 
 def get_computer_choice():
     """Generate a random choice for the computer with dramatic reveal."""
-    choices = ['rock', 'paper', 'scissors']
-    choice = random.choice(choices)
+    choice = CHOICES[_RNG.randrange(3)]
     
     # Add suspense
-    print("\n🤖 Computer is thinking...")
-    time.sleep(0.8)
-    print("🎲 Computer is making its choice...")
-    time.sleep(0.5)
-    
+    if ANIMATE:
+        print("\n🤖 Computer is thinking...\n🎲 Computer is making its choice...")
+        time.sleep(1.3)
+
     return choice
 
 def determine_winner(user_choice, computer_choice):
     """Determine the winner based on game rules."""
-    if user_choice == computer_choice:
-        return "tie"
-    elif (user_choice == "rock" and computer_choice == "scissors") or \
-         (user_choice == "scissors" and computer_choice == "paper") or \
-         (user_choice == "paper" and computer_choice == "rock"):
-        return "user"
-    else:
-        return "computer"
+    return _OUTCOME[(user_choice, computer_choice)]
 
 def display_result(user_choice, computer_choice, result):
     """Display the choices and result with enhanced visual appeal."""
-    # Create dramatic countdown
-    print("\n🥁 And the results are...")
-    time.sleep(0.5)
-    print("3...")
-    time.sleep(0.4)
-    print("2...")
-    time.sleep(0.4)
-    print("1...")
-    time.sleep(0.4)
-    print("🎊 REVEAL! 🎊")
-    time.sleep(0.3)
-    
-    # Map choices to emojis
-    emoji_map = {
-        'rock': '🪨',
-        'paper': '📄',
-        'scissors': '✂️'
-    }
-    
-    user_emoji = emoji_map[user_choice]
-    computer_emoji = emoji_map[computer_choice]
-    
-    # Display choices with visual appeal
-    print("\n" + "=" * 40)
-    print(f"   {user_emoji} YOU:      {user_choice.upper()}")
-    print("   🆚")
-    print(f"   {computer_emoji} COMPUTER: {computer_choice.upper()}")
-    print("=" * 40)
+    # Create dramatic countdown with one write and one combined sleep
+    if ANIMATE:
+        print("\n🥁 And the results are...")
+        time.sleep(0.5)
+        print("3...\n2...\n1...")
+        time.sleep(1.2)
+        print("🎊 REVEAL! 🎊")
+        time.sleep(0.3)
     
+    user_emoji = _EMOJI_MAP[user_choice]
+    computer_emoji = _EMOJI_MAP[computer_choice]
+
+    # Build the whole result block and flush it in a single write
+    buf = ["\n" + "=" * 40 + "\n",
+           f"   {user_emoji} YOU:      {user_choice.upper()}\n",
+           "   🆚\n",
+           f"   {computer_emoji} COMPUTER: {computer_choice.upper()}\n",
+           "=" * 40 + "\n"]
+
     # Announce result with appropriate celebration
     if result == "tie":
-        print("🤝 IT'S A TIE! Great minds think alike!")
-        print("🔄 Nobody gets a point this round.")
+        buf.append("🤝 IT'S A TIE! Great minds think alike!\n")
+        buf.append("🔄 Nobody gets a point this round.\n")
     elif result == "user":
-        print("🎉🎊 CONGRATULATIONS! YOU WIN! 🎊🎉")
-        print(f"✨ {user_choice.capitalize()} beats {computer_choice.capitalize()}!")
-        print("⭐ +1 point for you!")
+        buf.append("🎉🎊 CONGRATULATIONS! YOU WIN! 🎊🎉\n")
+        buf.append(f"✨ {user_choice.capitalize()} beats {computer_choice.capitalize()}!\n")
+        buf.append("⭐ +1 point for you!\n")
     else:
-        print("🤖 COMPUTER WINS THIS ROUND!")
-        print(f"💻 {computer_choice.capitalize()} beats {user_choice.capitalize()}!")
-        print("🔧 +1 point for computer!")
-    
-    print("=" * 40)
+        buf.append("🤖 COMPUTER WINS THIS ROUND!\n")
+        buf.append(f"💻 {computer_choice.capitalize()} beats {user_choice.capitalize()}!\n")
+        buf.append("🔧 +1 point for computer!\n")
+
+    buf.append("=" * 40 + "\n")
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
 
 def display_score(user_score, computer_score):
     """Display the current score with visual progress bars."""
@@ -131,10 +154,10 @@ def display_score(user_score, computer_score):
         user_percentage = (user_score / total_rounds) * 100
         computer_percentage = (computer_score / total_rounds) * 100
         
-        # Create progress bars (20 characters wide)
-        user_bar = "█" * int(user_percentage / 5) + "░" * (20 - int(user_percentage / 5))
-        computer_bar = "█" * int(computer_percentage / 5) + "░" * (20 - int(computer_percentage / 5))
-        
+        # Look up the prebuilt 20-character bars
+        user_bar = _BARS[int(user_percentage / 5)]
+        computer_bar = _BARS[int(computer_percentage / 5)]
+
         print(f"👤 YOU:      [{user_bar}] {user_score} ({user_percentage:.1f}%)")
         print(f"🤖 COMPUTER: [{computer_bar}] {computer_score} ({computer_percentage:.1f}%)")
     else:
@@ -185,8 +208,11 @@ def show_welcome():
 🎮🎊🎮🎊🎮🎊🎮🎊🎮🎊🎮🎊🎮🎊🎮🎊🎮🎊🎮🎊🎮🎊🎮🎊🎮
 """
     
-    print_with_delay(welcome_text, 0.01)
-    time.sleep(0.5)
+    if ANIMATE:
+        print_with_delay(welcome_text, 0.01)
+        time.sleep(0.5)
+    else:
+        print(welcome_text)
     
     print("🎯 GAME RULES - Simple and Fun!")
     print("=" * 45)
@@ -1,7 +1,88 @@
-import random
+import os
+import re
+import secrets
 import string
 
-def generate_password(length, include_uppercase=True, include_lowercase=True, 
+# Symbol set shared by generation and strength assessment
+_SYMBOL_CHARS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+_SYMBOL_SET = frozenset(_SYMBOL_CHARS)
+_LOWER_SET = frozenset(string.ascii_lowercase)
+_UPPER_SET = frozenset(string.ascii_uppercase)
+_DIGIT_SET = frozenset(string.digits)
+
+def _char_class_mask_py(password):
+    """Bit mask of character classes present (1 lower, 2 upper, 4 digit,
+    8 symbol), using set intersections that run at C speed."""
+    present = frozenset(password)
+    mask = 0
+    if not present.isdisjoint(_LOWER_SET):
+        mask |= 1
+    if not present.isdisjoint(_UPPER_SET):
+        mask |= 2
+    if not present.isdisjoint(_DIGIT_SET):
+        mask |= 4
+    if not present.isdisjoint(_SYMBOL_SET):
+        mask |= 8
+    return mask
+
+# numba compiles the class-mask loop to native code, which pays off when
+# auditing large password batches; fall back to the set-based path otherwise
+try:
+    import numba
+    import numpy
+
+    _CLASS_TABLE = numpy.zeros(256, dtype=numpy.uint8)
+    for _bit, _chars in ((1, string.ascii_lowercase), (2, string.ascii_uppercase),
+                         (4, string.digits), (8, _SYMBOL_CHARS)):
+        for _ch in _chars:
+            _CLASS_TABLE[ord(_ch)] = _bit
+
+    @numba.njit(cache=True)
+    def _mask_from_bytes(buf, table):
+        mask = 0
+        for c in buf:
+            mask |= table[c]
+            if mask == 15:
+                break
+        return mask
+
+    def _char_class_mask(password):
+        try:
+            buf = numpy.frombuffer(password.encode('ascii'), dtype=numpy.uint8)
+        except UnicodeEncodeError:
+            return _char_class_mask_py(password)
+        return int(_mask_from_bytes(buf, _CLASS_TABLE))
+except ImportError:
+    _char_class_mask = _char_class_mask_py
+
+# Alphabets cached per option mask so repeat calls skip the rebuild
+_ALPHABETS = {}
+
+# Password length at which drawing randomness in bulk beats per-char calls
+_BATCH_THRESHOLD = 32
+
+def _get_alphabet(include_lowercase, include_uppercase, include_digits, include_symbols):
+    """Return the cached tuple alphabet for this option mask, building it once."""
+    mask = (include_lowercase, include_uppercase, include_digits, include_symbols)
+    if not any(mask):
+        raise ValueError("At least one character type must be selected!")
+
+    alphabet = _ALPHABETS.get(mask)
+    if alphabet is None:
+        # Collect fragments and join once rather than repeated str +=
+        parts = []
+        if include_lowercase:
+            parts.append(string.ascii_lowercase)
+        if include_uppercase:
+            parts.append(string.ascii_uppercase)
+        if include_digits:
+            parts.append(string.digits)
+        if include_symbols:
+            parts.append(_SYMBOL_CHARS)
+        alphabet = _ALPHABETS[mask] = tuple(''.join(parts))
+    return alphabet
+
+def generate_password(length, include_uppercase=True, include_lowercase=True,
                      include_digits=True, include_symbols=True):
     """
     Generate a random password with specified length and complexity.
@@ -16,26 +97,60 @@ def generate_password(length, include_uppercase=True, include_lowercase=True,
     Returns:
         str: Generated password
     """
-    # Define character sets
-    characters = ""
-    
-    if include_lowercase:
-        characters += string.ascii_lowercase
-    if include_uppercase:
-        characters += string.ascii_uppercase
-    if include_digits:
-        characters += string.digits
-    if include_symbols:
-        characters += "!@#$%^&*()_+-=[]{}|;:,.<>?"
-    
-    # Ensure at least one character set is selected
-    if not characters:
-        raise ValueError("At least one character type must be selected!")
-    
-    # Generate password
-    password = ''.join(random.choice(characters) for _ in range(length))
+    alphabet = _get_alphabet(include_lowercase, include_uppercase,
+                             include_digits, include_symbols)
+
+    # Generate password with a cryptographically secure source. Long
+    # passwords draw all their randomness in one os.urandom call, using
+    # rejection sampling to keep the character distribution unbiased.
+    if length >= _BATCH_THRESHOLD:
+        n = len(alphabet)
+        limit = (256 // n) * n
+        chars = []
+        while len(chars) < length:
+            chars.extend(alphabet[b % n] for b in os.urandom(length * 2) if b < limit)
+        return ''.join(chars[:length])
+
+    password = ''.join(secrets.choice(alphabet) for _ in range(length))
     return password
 
+def generate_passwords(count, length, include_uppercase=True, include_lowercase=True,
+                       include_digits=True, include_symbols=True):
+    """
+    Generate several passwords at once for scripted/batch callers.
+
+    Draws all the randomness in one os.urandom call and slices it into
+    passwords, so per-password overhead stays constant.
+
+    Args:
+        count (int): Number of passwords to generate
+        length (int): Desired length of each password
+        include_uppercase (bool): Include uppercase letters
+        include_lowercase (bool): Include lowercase letters
+        include_digits (bool): Include digits
+        include_symbols (bool): Include special symbols
+
+    Returns:
+        list: Generated passwords
+    """
+    if count == 1:
+        return [generate_password(length, include_uppercase, include_lowercase,
+                                  include_digits, include_symbols)]
+
+    alphabet = _get_alphabet(include_lowercase, include_uppercase,
+                             include_digits, include_symbols)
+    n = len(alphabet)
+    limit = (256 // n) * n
+    needed = count * length
+
+    # One bulk draw with rejection sampling, topped up if the filter
+    # rejected too many bytes
+    chars = []
+    while len(chars) < needed:
+        buf = memoryview(os.urandom(needed * 2))
+        chars.extend(alphabet[b % n] for b in buf if b < limit)
+    return [''.join(chars[i:i + length]) for i in range(0, needed, length)]
+
 def get_user_preferences():
     """
     Get user preferences for password generation.
@@ -59,19 +174,30 @@ def get_user_preferences():
     
     print()
     print("Choose password complexity (you can select multiple options):")
-    
-    # Get complexity preferences
-    include_lowercase = input("Include lowercase letters (a-z)? (y/n, default: y): ").lower()
-    include_lowercase = include_lowercase != 'n'
-    
-    include_uppercase = input("Include uppercase letters (A-Z)? (y/n, default: y): ").lower()
-    include_uppercase = include_uppercase != 'n'
-    
-    include_digits = input("Include digits (0-9)? (y/n, default: y): ").lower()
-    include_digits = include_digits != 'n'
-    
-    include_symbols = input("Include special symbols (!@#$...)? (y/n, default: y): ").lower()
-    include_symbols = include_symbols != 'n'
+
+    # Fast path: all four answers in one line, e.g. "yyyn" for
+    # lower/upper/digits but no symbols
+    flags = input("Flags [lower,upper,digits,symbols] as 4-char y/n (e.g. yyyn), "
+                  "or press Enter to answer one by one: ").strip()
+    if re.fullmatch(r'[ynYN]{4}', flags):
+        flags = flags.lower()
+        include_lowercase = flags[0] != 'n'
+        include_uppercase = flags[1] != 'n'
+        include_digits = flags[2] != 'n'
+        include_symbols = flags[3] != 'n'
+    else:
+        # Get complexity preferences one question at a time
+        include_lowercase = input("Include lowercase letters (a-z)? (y/n, default: y): ").lower()
+        include_lowercase = include_lowercase != 'n'
+
+        include_uppercase = input("Include uppercase letters (A-Z)? (y/n, default: y): ").lower()
+        include_uppercase = include_uppercase != 'n'
+
+        include_digits = input("Include digits (0-9)? (y/n, default: y): ").lower()
+        include_digits = include_digits != 'n'
+
+        include_symbols = input("Include special symbols (!@#$...)? (y/n, default: y): ").lower()
+        include_symbols = include_symbols != 'n'
     
     # Ensure at least one option is selected
     if not any([include_lowercase, include_uppercase, include_digits, include_symbols]):
@@ -101,25 +227,17 @@ def assess_password_strength(password):
     else:
         feedback.append("Consider using at least 8 characters")
     
-    # Character variety checks
-    if any(c.islower() for c in password):
-        score += 1
-    else:
+    # Character variety: accumulate one class mask instead of four
+    # separate interpreter-level scans
+    mask = _char_class_mask(password)
+    score += bin(mask).count('1')
+    if not mask & 1:
         feedback.append("Add lowercase letters")
-    
-    if any(c.isupper() for c in password):
-        score += 1
-    else:
+    if not mask & 2:
         feedback.append("Add uppercase letters")
-    
-    if any(c.isdigit() for c in password):
-        score += 1
-    else:
+    if not mask & 4:
         feedback.append("Add numbers")
-    
-    if any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password):
-        score += 1
-    else:
+    if not mask & 8:
         feedback.append("Add special characters")
     
     # Determine strength
@@ -9,27 +9,25 @@ import os
 
 def clear_terminal():
     """Clear the terminal screen"""
+    # Writing the ANSI clear sequence avoids spawning a shell; fall back
+    # to os.system only for non-TTY output or dumb terminals
+    if sys.stdout.isatty() and os.environ.get('TERM') != 'dumb':
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+        return
     os.system('cls' if os.name == 'nt' else 'clear')
 
-# Handle termcolor import with fallback
+# Handle termcolor import with fallback; installing it is opt-in via
+# --install-deps rather than an automatic pip run on every cold start
 try:
     from termcolor import colored
     TERMCOLOR_AVAILABLE = True
 except ImportError:
     TERMCOLOR_AVAILABLE = False
-    try:
-        print("termcolor module not found. Installing...")
-        import subprocess
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "termcolor"])
-        from termcolor import colored
-        TERMCOLOR_AVAILABLE = True
-        print("termcolor installed successfully!")
-    except Exception as e:
-        print(f"Could not install termcolor: {e}")
-        # Fallback function for colored output
-        def colored(text, color=None, attrs=None):
-            return text
-        TERMCOLOR_AVAILABLE = False
+
+    # Fallback function for colored output
+    def colored(text, color=None, attrs=None):
+        return text
 
 class SimpleCalculator:
     """A simple calculator class with basic arithmetic operations"""
@@ -37,69 +35,99 @@ class SimpleCalculator:
     def __init__(self):
         self.operations = {
             '1': ('+', 'Addition'),
-            '2': ('-', 'Subtraction'), 
+            '2': ('-', 'Subtraction'),
             '3': ('*', 'Multiplication'),
             '4': ('/', 'Division'),
             '5': ('%', 'Modulus'),
             '6': ('**', 'Power')
         }
-    
+
+        # Bound-method dispatch table: one dict lookup per calculation
+        # instead of walking an if/elif chain
+        self._dispatch = {
+            '1': (self.add, '+'),
+            '2': (self.subtract, '-'),
+            '3': (self.multiply, '*'),
+            '4': (self.divide, '/'),
+            '5': (self.modulus, '%'),
+            '6': (self.power, '**')
+        }
+
+        # Every accepted menu key, including Exit, in one small set
+        self._valid_choices = frozenset(self.operations) | {'7'}
+
+        # The menu and banners never change, so color and assemble them
+        # once here; the no-op colored fallback keeps plain output intact
+        menu_lines = [
+            colored("\n" + "="*50, "cyan"),
+            colored("         SIMPLE CALCULATOR", "yellow", attrs=['bold']),
+            colored("="*50, "cyan"),
+            colored("Select an operation:", "green"),
+        ]
+        menu_lines.extend(colored(f"  {key}. {name} ({symbol})", "white")
+                          for key, (symbol, name) in self.operations.items())
+        menu_lines.append(colored("  7. Exit", "red"))
+        menu_lines.append(colored("="*50, "cyan"))
+        self._menu_str = '\n'.join(menu_lines) + '\n'
+
+        self._result_rule = colored("─"*40, "blue")
+        self._result_label = colored("RESULT:", "green", attrs=['bold'])
+
+        self._welcome = colored("🔢 Welcome to the Simple Calculator! 🔢", "magenta", attrs=['bold'])
+        self._goodbye = colored("\n👋 Thank you for using Simple Calculator! Goodbye!", "magenta")
+
+        # Fixed error text, rendered once; dynamic errors go through
+        # colored() at the (rare) point of failure
+        self._msg_invalid_number = colored("❌ Invalid input! Please enter a valid number.", "red")
+        self._msg_invalid_choice = colored("❌ Invalid choice! Please select 1-7.", "red")
+        self._msg_try_again = colored("Please try again.", "yellow")
+        self._msg_interrupted = colored("\n\n⚠️ Calculator interrupted by user. Goodbye!", "yellow")
+
+        # Prompts are fixed too; color them once instead of per input call
+        self._prompt_first = colored("Enter the first number: ", "cyan")
+        self._prompt_second = colored("Enter the second number: ", "cyan")
+        self._prompt_choice = colored("Enter your choice (1-7): ", "yellow")
+        self._prompt_continue = colored("\nDo you want to perform another calculation? (y/n): ", "yellow")
+
+    @staticmethod
+    def _prompt(prompt):
+        """Write a pre-rendered prompt and read one reply line, skipping
+        the extra bookkeeping input() does per call"""
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+
     def display_menu(self):
         """Display the calculator menu"""
-        if TERMCOLOR_AVAILABLE:
-            print(colored("\n" + "="*50, "cyan"))
-            print(colored("         SIMPLE CALCULATOR", "yellow", attrs=['bold']))
-            print(colored("="*50, "cyan"))
-            print(colored("Select an operation:", "green"))
-        else:
-            print("\n" + "="*50)
-            print("         SIMPLE CALCULATOR")
-            print("="*50)
-            print("Select an operation:")
-        
-        for key, (symbol, name) in self.operations.items():
-            if TERMCOLOR_AVAILABLE:
-                print(colored(f"  {key}. {name} ({symbol})", "white"))
-            else:
-                print(f"  {key}. {name} ({symbol})")
-        
-        if TERMCOLOR_AVAILABLE:
-            print(colored("  7. Exit", "red"))
-            print(colored("="*50, "cyan"))
-        else:
-            print("  7. Exit")
-            print("="*50)
+        sys.stdout.write(self._menu_str)
+        sys.stdout.flush()
     
     def get_number(self, prompt):
         """Get a valid number from user input"""
+        _float = float
         while True:
+            user_input = self._prompt(prompt).strip()
+            if not user_input:
+                # Obviously not a number; skip the exception machinery
+                print(self._msg_invalid_number)
+                continue
             try:
-                if TERMCOLOR_AVAILABLE:
-                    user_input = input(colored(prompt, "cyan"))
-                else:
-                    user_input = input(prompt)
-                return float(user_input)
+                return _float(user_input)
             except ValueError:
-                if TERMCOLOR_AVAILABLE:
-                    print(colored("❌ Invalid input! Please enter a valid number.", "red"))
-                else:
-                    print("❌ Invalid input! Please enter a valid number.")
+                print(self._msg_invalid_number)
     
     def get_operation_choice(self):
         """Get operation choice from user"""
         while True:
-            if TERMCOLOR_AVAILABLE:
-                choice = input(colored("Enter your choice (1-7): ", "yellow"))
-            else:
-                choice = input("Enter your choice (1-7): ")
-            
-            if choice in self.operations or choice == '7':
+            choice = self._prompt(self._prompt_choice)
+
+            if choice in self._valid_choices:
                 return choice
             else:
-                if TERMCOLOR_AVAILABLE:
-                    print(colored("❌ Invalid choice! Please select 1-7.", "red"))
-                else:
-                    print("❌ Invalid choice! Please select 1-7.")
+                print(self._msg_invalid_choice)
     
     def add(self, a, b):
         """Addition operation"""
@@ -132,60 +160,34 @@ class SimpleCalculator:
     def calculate(self, num1, num2, operation):
         """Perform calculation based on operation choice"""
         try:
-            if operation == '1':
-                result = self.add(num1, num2)
-                symbol = '+'
-            elif operation == '2':
-                result = self.subtract(num1, num2)
-                symbol = '-'
-            elif operation == '3':
-                result = self.multiply(num1, num2)
-                symbol = '*'
-            elif operation == '4':
-                result = self.divide(num1, num2)
-                symbol = '/'
-            elif operation == '5':
-                result = self.modulus(num1, num2)
-                symbol = '%'
-            elif operation == '6':
-                result = self.power(num1, num2)
-                symbol = '**'
-            
+            operation_func, symbol = self._dispatch[operation]
+            result = operation_func(num1, num2)
             return result, symbol
-            
+
+
         except ZeroDivisionError as e:
-            if TERMCOLOR_AVAILABLE:
-                print(colored(f"❌ Error: {e}", "red"))
-            else:
-                print(f"❌ Error: {e}")
+            print(colored(f"❌ Error: {e}", "red"))
             return None, None
         except Exception as e:
-            if TERMCOLOR_AVAILABLE:
-                print(colored(f"❌ An error occurred: {e}", "red"))
-            else:
-                print(f"❌ An error occurred: {e}")
+            print(colored(f"❌ An error occurred: {e}", "red"))
             return None, None
     
     def display_result(self, num1, num2, symbol, result):
         """Display the calculation result"""
-        if TERMCOLOR_AVAILABLE:
-            print(colored("\n" + "─"*40, "blue"))
-            print(colored("RESULT:", "green", attrs=['bold']))
-            print(colored(f"{num1} {symbol} {num2} = {result}", "blue", attrs=['bold']))
-            print(colored("─"*40, "blue"))
-        else:
-            print("\n" + "─"*40)
-            print("RESULT:")
-            print(f"{num1} {symbol} {num2} = {result}")
-            print("─"*40)
+        # One buffered write per screen instead of four print calls
+        lines = [
+            "\n" + self._result_rule,
+            self._result_label,
+            colored(f"{num1} {symbol} {num2} = {result}", "blue", attrs=['bold']),
+            self._result_rule,
+        ]
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
     
     def run(self):
         """Main calculator loop"""
         clear_terminal()  # Clear terminal at start
-        if TERMCOLOR_AVAILABLE:
-            print(colored("🔢 Welcome to the Simple Calculator! 🔢", "magenta", attrs=['bold']))
-        else:
-            print("🔢 Welcome to the Simple Calculator! 🔢")
+        print(self._welcome)
         
         while True:
             try:
@@ -196,15 +198,12 @@ class SimpleCalculator:
                 
                 # Exit option
                 if choice == '7':
-                    if TERMCOLOR_AVAILABLE:
-                        print(colored("\n👋 Thank you for using Simple Calculator! Goodbye!", "magenta"))
-                    else:
-                        print("\n👋 Thank you for using Simple Calculator! Goodbye!")
+                    print(self._goodbye)
                     break
                 
                 # Get numbers
-                num1 = self.get_number("Enter the first number: ")
-                num2 = self.get_number("Enter the second number: ")
+                num1 = self.get_number(self._prompt_first)
+                num2 = self.get_number(self._prompt_second)
                 
                 # Perform calculation
                 result, symbol = self.calculate(num1, num2, choice)
@@ -214,31 +213,18 @@ class SimpleCalculator:
                     self.display_result(num1, num2, symbol, result)
                 
                 # Ask if user wants to continue
-                if TERMCOLOR_AVAILABLE:
-                    continue_calc = input(colored("\nDo you want to perform another calculation? (y/n): ", "yellow")).lower()
-                else:
-                    continue_calc = input("\nDo you want to perform another calculation? (y/n): ").lower()
+                continue_calc = self._prompt(self._prompt_continue).lower()
                 
                 if continue_calc not in ['y', 'yes']:
-                    if TERMCOLOR_AVAILABLE:
-                        print(colored("\n👋 Thank you for using Simple Calculator! Goodbye!", "magenta"))
-                    else:
-                        print("\n👋 Thank you for using Simple Calculator! Goodbye!")
+                    print(self._goodbye)
                     break
                     
             except KeyboardInterrupt:
-                if TERMCOLOR_AVAILABLE:
-                    print(colored("\n\n⚠️ Calculator interrupted by user. Goodbye!", "yellow"))
-                else:
-                    print("\n\n⚠️ Calculator interrupted by user. Goodbye!")
+                print(self._msg_interrupted)
                 break
             except Exception as e:
-                if TERMCOLOR_AVAILABLE:
-                    print(colored(f"\n❌ An unexpected error occurred: {e}", "red"))
-                    print(colored("Please try again.", "yellow"))
-                else:
-                    print(f"\n❌ An unexpected error occurred: {e}")
-                    print("Please try again.")
+                print(colored(f"\n❌ An unexpected error occurred: {e}", "red"))
+                print(self._msg_try_again)
 
 # Alternative simple function-based calculator
 def simple_calculator():
@@ -285,8 +271,20 @@ def simple_calculator():
         print(f"Error: {e}")
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simple calculator")
+    parser.add_argument('--install-deps', action='store_true',
+                        help='Install optional dependencies (termcolor) and exit')
+    args = parser.parse_args()
+
+    if args.install_deps:
+        import subprocess
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "termcolor"])
+        sys.exit(0)
+
     # You can choose which calculator to run:
-    
+
     # Option 1: Advanced calculator with menu and colored output
     calculator = SimpleCalculator()
     calculator.run()